@@ -2,91 +2,168 @@
 # coding: utf-8
 
 import argparse
-import csv
+import functools
 import math
+from collections import defaultdict, deque
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 import helpers
 
-parser = argparse.ArgumentParser(description='cavemap 2000')
-parser.add_argument('files', nargs='*', type=str)
-parser.add_argument('--plan', action='store_true', default=False,
-                    dest='plan',
-                    help='Plot a plan view')
-parser.add_argument('--profile', action='store_true', default=False,
-                    dest='profile',
-                    help='Plot a profile view')
-parser.add_argument('--flat', action='store_true', default=False,
-                    dest='flat',
-                    help='Plot a flat profile view')
-parser.add_argument('--3d', action='store_true', default=False,
-                    dest='three_d',
-                    help='Plot a 3d view')
-
-args = parser.parse_args()
-paths = args.files
-path = paths[0]
-plan = args.plan
-profile = args.profile
-flat = args.flat
-three_d = args.three_d
+try:
+    import mplcursors
+except ImportError:  # mplcursors is optional, only used for hover labels
+    mplcursors = None
+
+DEG2RAD = np.pi/180
 
 #%%
 # helper parsing functions
-def parse_float(string):
-    if string == '':
-        return None
-    else:
-        return float(string)
-
-def parse_multi_float(string):
-    """ If string format is float/float, returns a (float,float) tuple.
-        Otherwise, returns a float. Throws an exception if neither works."""
-    try:
-        return parse_float(string)
-    except ValueError:
-        return tuple([float(x) for x in string.split('/')[:2]])
+STRING_FIELDS = ['from', 'name', 'note']
+FLOAT_FIELDS = ['distance']
+UNION_FIELDS = ['azimuth', 'inclination', 'left', 'right', 'up', 'down']
+
+def csv_to_frame(filepath):
+    """ Reads a CSV file into a DataFrame with one row per shot.
+    Union fields (float/float or float) are split into <field>_fore and
+    <field>_back float columns, with NaN where a value is missing.
+    Doesn't do the work of verifying that values are sensible"""
+    # union fields are read as str, since pandas infers types chunk by chunk
+    # and may mix floats and strs within one column of a large file
+    dtypes = {field: str for field in STRING_FIELDS + UNION_FIELDS}
+    dtypes.update({field: np.float64 for field in FLOAT_FIELDS})
+    frame = pd.read_csv(filepath, dtype=dtypes)
+
+    for field in STRING_FIELDS:
+        frame[field] = frame[field].fillna('')
+    for field in UNION_FIELDS:
+        paired = frame[field].str.contains('/', regex=False, na=False)
+        if not paired.any():
+            # no float/float values anywhere in the column, skip the split
+            frame[field+'_fore'] = pd.to_numeric(frame[field]).astype(np.float64)
+            frame[field+'_back'] = np.nan
+            continue
+        split = frame[field].str.split('/', expand=True)
+        # a pair needs both halves, '5/' is a typo rather than a foresight only
+        malformed = paired & ((split[0].str.strip() == '') | (split[1].str.strip() == ''))
+        if malformed.any():
+            bad = [f"{row['from']}-->{row['name']} ({row[field]})"
+                   for _, row in frame[malformed].iterrows()]
+            raise ValueError(f"Malformed {field} in shots: {', '.join(bad)}")
+        frame[field+'_fore'] = pd.to_numeric(split[0]).astype(np.float64)
+        frame[field+'_back'] = pd.to_numeric(split[1]).astype(np.float64)
+    return frame.drop(columns=UNION_FIELDS)
+
+def frame_to_shots(frame):
+    """ Converts a DataFrame from csv_to_frame to shot_info dicts."""
+    shots = frame[STRING_FIELDS + FLOAT_FIELDS].to_dict('records')
+    for field in UNION_FIELDS:
+        fore = frame[field+'_fore'].tolist()
+        back = frame[field+'_back'].tolist()
+        for shot, f, b in zip(shots, fore, back):
+            if math.isnan(f):
+                shot[field] = None
+            elif math.isnan(b):
+                shot[field] = f
+            else:
+                shot[field] = (f, b)
+    return shots
 
 def csv_to_shots(filepath):
     """ Converts a CSV file to shot_info dicts.
     Doesn't do the work of verifying that values are sensible"""
-
-    # read in data
-    with open(filepath, 'r', newline='') as csvfile:
-        reader = csv.reader(csvfile, delimiter=',')
-        labels = reader.__next__()
-        rows = []
-        for row in reader:
-            rows.append(row)
-
-    # use labels to make row to dict parser
-    columns = {}
-    for i, label in enumerate(labels):
-        columns[label] = i
-
-    string_fields = ['from', 'name', 'note']
-    float_fields = ['distance']
-    union_fields = ['azimuth', 'inclination', 'left', 'right', 'up', 'down']
-
-    def parse_row(row):
-        info = {}
-        try:  # different treatment for different fields
-            for field in string_fields:
-                info[field] = row[columns[field]]
-            for field in float_fields:
-                info[field] = parse_float(row[columns[field]])
-            for field in union_fields:
-                info[field] = parse_multi_float(row[columns[field]])
-        except ValueError:
-            print(row, field)
-            raise
-        return info
-
-    return list(map(parse_row, rows))
-
-
+    return frame_to_shots(csv_to_frame(filepath))
+
+def split_fore_back(values):
+    """ Splits tuple(float, float) / float values into foresight and backsight
+    arrays. Backsight is NaN where only a foresight was taken."""
+    n = len(values)
+    fore = np.fromiter((v[0] if isinstance(v, tuple) else v for v in values),
+                       dtype=np.float64, count=n)
+    back = np.fromiter((v[1] if isinstance(v, tuple) else np.nan for v in values),
+                       dtype=np.float64, count=n)
+    return fore, back
+
+def average_azimuth(fore, back):
+    """ Averages foresight and backsight azimuth arrays, in degrees.
+    Where backsight is NaN, the foresight is used as is."""
+    return np.where(np.isnan(back), fore, 0.5*(fore + np.mod(back+180, 360.0)))
+
+def average_inclination(fore, back):
+    """ Averages foresight and backsight inclination arrays, in degrees.
+    Where backsight is NaN, the foresight is used as is."""
+    return np.where(np.isnan(back), fore, 0.5*(fore - back))
+
+def shot_offsets(dist, azi, incl):
+    """ Calculates the change in position of every shot at once.
+    Args:
+        dist (np.ndarray): shot lengths, shape (N,)
+        azi (np.ndarray): azimuths in degrees, shape (N,)
+        incl (np.ndarray): inclinations in degrees, shape (N,)
+    Returns:
+        (N,3) array of (x,y,z) offsets and (N,2) array of flattened (w,z) offsets
+    """
+    azi = azi * DEG2RAD
+    incl = incl * DEG2RAD
+    horiz = dist * np.cos(incl)
+    vert = dist * np.sin(incl)
+    offsets = np.column_stack((horiz * np.sin(azi), horiz * np.cos(azi), vert))
+    flat_offsets = np.column_stack((horiz, vert))
+    return offsets, flat_offsets
+
+def calc_pos(prev, dist, azi, incl):
+    """Calculates the absolute position of a new shot"""
+    x0, y0, z0 = prev
+    incl_rad, azi_rad = incl*DEG2RAD, azi*DEG2RAD
+    horiz = dist * math.cos(incl_rad)
+    x = x0 + horiz * math.sin(azi_rad)
+    y = y0 + horiz * math.cos(azi_rad)
+    z = z0 + dist * math.sin(incl_rad)
+    return (x,y,z)
+
+def calc_pos_flat(prev, dist, incl):
+    """Calculates the position of a new shot in a flattened profile view"""
+    w0, z0 = prev
+    incl_rad = incl*DEG2RAD
+    w = w0 + dist * math.cos(incl_rad)
+    z = z0 + dist * math.sin(incl_rad)
+    return (w,z)
+
+
+def accumulate_positions(offsets, parents, out):
+    """ Places each shot at its parent's position plus its own offset.
+    Args:
+        offsets (np.ndarray): shot offsets, shape (N,dims)
+        parents (np.ndarray): row of each shot's parent, shape (N,).
+            Parents must come before their children; -1 is the origin.
+        out (np.ndarray): positions, shape (N+1,dims). The last row holds
+            the origin and is left untouched.
+    """
+    for i in range(offsets.shape[0]):
+        for j in range(offsets.shape[1]):
+            out[i, j] = out[parents[i], j] + offsets[i, j]
+
+# compiling takes about as long as the plain loop over ~150k shots,
+# so smaller surveys aren't worth jitting
+JIT_MIN_SHOTS = 100000
+
+@functools.lru_cache(maxsize=None)
+def jit_accumulate_positions():
+    """ Returns accumulate_positions compiled with numba, or as is if numba
+    isn't installed. numba is only imported on first call, since importing
+    it is slow and only large surveys use it."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional, the kernel runs as plain python without it
+        return accumulate_positions
+    try:
+        return njit(cache=True)(accumulate_positions)
+    except RuntimeError:  # no cache locator, e.g. when not loaded from a file
+        return njit(accumulate_positions)
 
 #%%
 class LinePlot():
@@ -99,11 +176,34 @@ class LinePlot():
 
     def __init__(self, title='Cave', dist_units='feet', angle_tol=2.0):
         self.shots = []
-        self.shot_names = [] # extra list for faster lookup
+        self.shot_names = set() # extra set for faster lookup
         self.title = title
         self.dist_units = dist_units
         self.angle_tol = angle_tol
         self.origin_name = None
+        self.parents = np.zeros(0, dtype=np.intp)
+        self.positions = np.zeros((0, 3))
+        self.flat_positions = np.zeros((0, 2))
+        self.shot_rows = {} # station name -> row in positions
+        self.positions_ready = False
+        self.frame = None # survey columns from from_dataframe, row-aligned with shots
+        self.azimuth_deg = np.zeros(0)
+        self.inclination_deg = np.zeros(0)
+        self.row_buffers = {} # spare capacity behind the per-shot arrays, see append_row
+
+
+    @classmethod
+    def from_dataframe(cls, frame, **kwargs):
+        """ Creates a line plot from a survey DataFrame.
+        Args:
+            frame (pd.DataFrame): shots, as returned by csv_to_frame
+            **kwargs: passed on to LinePlot
+        """
+        lineplot = cls(**kwargs)
+        for shot_info in frame_to_shots(frame):
+            lineplot.add_shot(shot_info)
+        lineplot.frame = frame.reset_index(drop=True)
+        return lineplot
 
 
     def add_shot(self, shot_info):
@@ -135,116 +235,173 @@ class LinePlot():
                     print(f"WARNING: {value} in shot {name}  has a value of {abs(value[0]-val_1)} and is not within bounds of {self.angle_tol}")
         assert shot_info['distance'] > 0
         self.shots.append(shot_info)
-        self.shot_names.append(shot_info['name'])
+        self.shot_names.add(shot_info['name'])
+        self.frame = None
+
+        # extend already processed positions in place, unless the parent isn't placed yet
+        if self.positions_ready:
+            if shot_info['from'] in self.shot_rows:
+                self.place_shot(shot_info)
+            else:
+                self.positions_ready = False
+
+
+    def place_shot(self, shot_info):
+        """ Positions the last added shot from its already placed parent."""
+        azi_fore, azi_back = split_fore_back([shot_info['azimuth']])
+        incl_fore, incl_back = split_fore_back([shot_info['inclination']])
+        azi = average_azimuth(azi_fore, azi_back)[0]
+        incl = average_inclination(incl_fore, incl_back)[0]
+        if np.isnan(azi) or np.isnan(incl):
+            # leave it to process() to report the bad shot
+            self.positions_ready = False
+            return
+
+        parent = self.shot_rows[shot_info['from']]
+        if parent < 0:
+            prev, prev_flat = (0, 0, 0), (0, 0)
+        else:
+            prev, prev_flat = self.positions[parent], self.flat_positions[parent]
+        position = calc_pos(prev, shot_info['distance'], azi, incl)
+        flat_position = calc_pos_flat(prev_flat, shot_info['distance'], incl)
+
+        self.shot_rows.setdefault(shot_info['name'], len(self.parents))
+        self.append_row(parents=parent, azimuth_deg=azi, inclination_deg=incl,
+                        positions=position, flat_positions=flat_position)
+
+
+    def append_row(self, **values):
+        """ Appends one row to each of the named per-shot arrays.
+        The arrays are views into buffers that double in size when full,
+        so a stream of appends doesn't copy every row each time."""
+        n = len(self.parents)
+        for field, value in values.items():
+            current = getattr(self, field)
+            buffer = self.row_buffers.get(field)
+            if buffer is None or len(buffer) == n:
+                buffer = np.empty((max(2*n, 16),) + current.shape[1:], dtype=current.dtype)
+                buffer[:n] = current
+                self.row_buffers[field] = buffer
+            buffer[n] = value
+            setattr(self, field, buffer[:n+1])
 
 
     def process(self):
-        """ Modifies shots to prepare for plotting.
+        """ Prepares shots for plotting.
         Takes average of angle coords
-        Adds new global position field of type tuple(x,y,z)"""
-
-        def calc_pos(prev, shot): # TODO - put this elsewhere?
-            """Calculates the absolute position of a new shot"""
-            x0, y0, z0 = prev['position']
-            dist, azi, incl = shot['distance'], shot['azimuth'], shot['inclination']
-            x = x0 + dist * math.cos(incl*2*np.pi/360) * math.sin(azi*2*np.pi/360)
-            y = y0 + dist * math.cos(incl*2*np.pi/360) * math.cos(azi*2*np.pi/360)
-            z = z0 + dist * math.sin(incl*2*np.pi/360)
-            return (x,y,z)
-
-        def calc_pos_flat(prev, shot): # TODO - put this elsewhere?
-            """Calculates the position of a new shot in a flattened profile view"""
-            w0, z0 = prev['flat_position']
-            dist, incl = shot['distance'], shot['inclination']
-            w = w0 + dist * math.cos(incl*2*np.pi/360)
-            z = z0 + dist * math.sin(incl*2*np.pi/360)
-            return (w,z)
-
-
+        Orders shots so that each one follows its parent, and fills
+        azimuth_deg (N,), inclination_deg (N,), positions (N,3),
+        flat_positions (N,2) and parents (N,) arrays, row-aligned with shots.
+        A parent of -1 is the origin.
+        Shots added afterwards are placed as they come, see add_shot.
+        Raises ValueError if a shot is missing its distance or an angle."""
+
+        n = len(self.shots)
+        if self.frame is not None:
+            # fore and backsights are already split into columns at ingest
+            dist = self.frame['distance'].to_numpy(np.float64)
+            azi_fore = self.frame['azimuth_fore'].to_numpy(np.float64)
+            azi_back = self.frame['azimuth_back'].to_numpy(np.float64)
+            incl_fore = self.frame['inclination_fore'].to_numpy(np.float64)
+            incl_back = self.frame['inclination_back'].to_numpy(np.float64)
+        else:
+            dist = np.fromiter((shot['distance'] for shot in self.shots),
+                               dtype=np.float64, count=n)
+            azi_fore, azi_back = split_fore_back([shot['azimuth'] for shot in self.shots])
+            incl_fore, incl_back = split_fore_back([shot['inclination'] for shot in self.shots])
 
         # take angle averages where applicable
-        for shot in self.shots:
-            azi = shot['azimuth']
-            if isinstance(azi, tuple):
-                shot['azimuth'] = (azi[0] + (azi[1]+180)%360)/2.0
-            incl = shot['inclination']
-            if isinstance(incl, tuple):
-                shot['inclination'] = (incl[0] - incl[1])/2.0
-
-        unfinished = self.shots[:]
-        done = []
-        done_names = lambda: [shot['name'] for shot in done]
+        azi = average_azimuth(azi_fore, azi_back)
+        incl = average_inclination(incl_fore, incl_back)
 
-        # we arbitratily call the first point the origin
-        first = unfinished.pop(0)
-        first['position'] = calc_pos({'position':(0,0,0)}, first)
-        first['flat_position'] = calc_pos_flat({'flat_position':(0,0)}, first)
-        self.origin_name = first['from']
-        done.append(first)
-
-
-        # look for shots we can now link
-        # TODO - check for unfilled values earlier on
-        # TODO - make this a pretty algorithm
-        looped_twice = False
-        while len(unfinished) > 0:
-            for shot in unfinished:
-                if shot['from'] in done_names():
-                    prev = next(s for s in done if s['name']==shot['from'])
-                    # calculate new global position
-                    shot['position'] = calc_pos(prev, shot)
-                    shot['flat_position'] = calc_pos_flat(prev, shot)
-                    # finished, move between lists
-                    done.append(shot)
-                    unfinished.remove(shot)
-                    looped_twice = False
-                    continue
-            if looped_twice:
-                raise ValueError('Provided shots do not connect from origin')
-            else:
-                looped_twice = True
-        self.shots = done
+        # unfilled values would otherwise spread NaN to every shot downstream
+        missing = np.isnan(dist) | np.isnan(azi) | np.isnan(incl)
+        if missing.any():
+            names = [self.shots[i]['from'] + '-->' + self.shots[i]['name']
+                     for i in np.flatnonzero(missing)]
+            raise ValueError(f"Shots missing distance, azimuth or inclination: {', '.join(names)}")
 
+        offsets, flat_offsets = shot_offsets(dist, azi, incl)
 
-    def plot(self, view='3d', angle=0):
+        # we arbitratily call the first point the origin
+        self.origin_name = self.shots[0]['from']
+        children = defaultdict(list)
+        for i, shot in enumerate(self.shots):
+            children[shot['from']].append(i)
+
+        # link shots outward from the origin, so parents are placed before children
+        queue = deque((-1, i) for i in children[self.origin_name])
+        rows = {self.origin_name: -1}
+        order = []
+        parents = []
+        while queue:
+            parent, i = queue.popleft()
+            row = len(order)
+            order.append(i)
+            parents.append(parent)
+            name = self.shots[i]['name']
+            if name not in rows:
+                rows[name] = row
+                queue.extend((row, j) for j in children[name])
+        if len(order) != n:
+            raise ValueError('Provided shots do not connect from origin')
+
+        # calculate global positions. the extra last row stays at the origin,
+        # so a parent index of -1 refers to it
+        offsets, flat_offsets = offsets[order], flat_offsets[order]
+        positions = np.zeros((n+1, 3))
+        flat_positions = np.zeros((n+1, 2))
+        parents = np.array(parents, dtype=np.intp)
+        if n >= JIT_MIN_SHOTS:
+            accumulate = jit_accumulate_positions()
+        else:
+            accumulate = accumulate_positions
+        accumulate(offsets, parents, positions)
+        accumulate(flat_offsets, parents, flat_positions)
+
+        self.shots = [self.shots[i] for i in order]
+        if self.frame is not None:
+            self.frame = self.frame.iloc[order].reset_index(drop=True)
+        self.azimuth_deg = azi[order]
+        self.inclination_deg = incl[order]
+        self.parents = parents
+        self.positions = positions[:n]
+        self.flat_positions = flat_positions[:n]
+        self.shot_rows = rows
+        self.row_buffers = {}
+        self.positions_ready = True
+
+
+    def plot(self, view='3d', angle=0, label_max=500):
         """ Plots a cave.
         Args:
             view (str): 3d, plan, profile, or flat_profile
             angle (float): if profile is selected, plot at angle relative to N
+            label_max (int): most station labels to draw. Larger surveys only
+                label every few stations plus the origin, and show the rest
+                on hover if mplcursors is installed. 0 draws no text labels.
             """
         # TODO - use angle
+        if not self.positions_ready:
+            self.process()
 
         # prepare segments and labels to plot
-        pos_type = 'flat_position' if view == 'flat_profile' else 'position'
-        points = [shot[pos_type] for shot in self.shots]
+        positions = self.flat_positions if view == 'flat_profile' else self.positions
         labels = [shot['name'] for shot in self.shots]
-        # add origin
-        points.append((0, 0, 0))
+        # add origin last, so a parent index of -1 refers to it
+        points = np.vstack((positions, np.zeros(positions.shape[1])))
         labels.append(self.origin_name)
-
-
-        segments = []
-        for shot in self.shots:
-            try:
-                prev = next(s for s in self.shots if s['name']==shot['from'])
-                p0 = prev[pos_type]
-            except StopIteration:
-                if shot['from'] == self.origin_name:
-                    p0 = (0, 0, 0)
-                else:
-                    print(self.origin_name)
-                    raise
-            p1 = shot[pos_type]
-            segments.append(tuple(zip(p0,p1)))
+        # shape (N, 2, dims): start and end point of each shot
+        segments = np.stack((points[self.parents], points[:-1]), axis=1)
 
         if view in ['plan', 'flat_profile']:
-            # reduce points and lines to 2d. for flat_prof this just trims the origin point
-            points = [p[:2] for p in points]
-            segments = [s[:2] for s in segments]
+            # reduce points and lines to 2d. for flat_prof this is a no-op
+            points = points[:, :2]
+            segments = segments[:, :, :2]
         elif view == 'profile':
             # reduce points and lines to 2d
-            points = [p[1:] for p in points]
-            segments = [s[1:] for s in segments]
+            points = points[:, 1:]
+            segments = segments[:, :, 1:]
         elif view == '3d':
             pass
         else:
@@ -253,41 +410,74 @@ class LinePlot():
         # prepare axes
         fig = plt.figure()
         if view == '3d':
-            ax = fig.gca(projection='3d')
+            ax = fig.add_subplot(projection='3d')
         else:
             ax = fig.gca()
             ax.set_aspect('equal', adjustable='box')
             plt.axis('off')
 
         # create plot
-        ax.scatter(*zip(*points), marker='^')
-        for seg in segments:
-            ax.plot(*seg, c='black')
-            if view == '3d':
-                ax.plot(*seg, lw=10, alpha=0.2)
-                helpers.set_axes_equal(ax)
+        scatter = ax.scatter(*points.T, marker='^')
+        if view == '3d':
+            ax.add_collection3d(Line3DCollection(segments, colors='black'))
+            ax.add_collection3d(Line3DCollection(segments, linewidths=10, alpha=0.2))
+            helpers.set_axes_equal(ax)
+        else:
+            ax.add_collection(LineCollection(segments, colors='black'))
+        # each label is its own artist, so thin them out on large surveys.
+        # the origin is last and always labelled, it's the survey's tie-in point
+        if label_max <= 0:
+            shown = []
+        elif len(labels) <= label_max:
+            shown = range(len(labels))
+        else:
+            # one slot is kept for the origin
+            stations = len(labels) - 1
+            shown = [stations]
+            if label_max > 1:
+                step = math.ceil(stations / (label_max-1))
+                shown = list(range(0, stations, step)) + shown
         annotations = []
-        for i, txt in enumerate(labels):
-            annotations.append(ax.text(*points[i], txt))
+        for i in shown:
+            annotations.append(ax.text(*points[i], labels[i]))
+        if len(shown) < len(labels) and mplcursors is not None:
+            cursor = mplcursors.cursor(scatter, hover=True)
+            cursor.connect('add', lambda sel: sel.annotation.set_text(labels[sel.index]))
         ax.set_title(self.title)
         plt.show()
 
 
 #%%
-lineplot = LinePlot()
-infos = csv_to_shots(path)
-for info in infos:
-    lineplot.add_shot(info)
-lineplot.process()
-if profile:
-    lineplot.plot(view='profile')
-if plan:
-    lineplot.plot(view='plan')
-if flat:
-    lineplot.plot(view='flat_profile')
-if three_d:
-    lineplot.plot(view='3d')
-
-
-
-
+def main():
+    """ Command line entry point: plots the requested views of a survey CSV."""
+    parser = argparse.ArgumentParser(description='cavemap 2000')
+    parser.add_argument('files', nargs='+', type=str)
+    parser.add_argument('--plan', action='store_true', default=False,
+                        dest='plan',
+                        help='Plot a plan view')
+    parser.add_argument('--profile', action='store_true', default=False,
+                        dest='profile',
+                        help='Plot a profile view')
+    parser.add_argument('--flat', action='store_true', default=False,
+                        dest='flat',
+                        help='Plot a flat profile view')
+    parser.add_argument('--3d', action='store_true', default=False,
+                        dest='three_d',
+                        help='Plot a 3d view')
+
+    args = parser.parse_args()
+
+    lineplot = LinePlot.from_dataframe(csv_to_frame(args.files[0]))
+    lineplot.process()
+    if args.profile:
+        lineplot.plot(view='profile')
+    if args.plan:
+        lineplot.plot(view='plan')
+    if args.flat:
+        lineplot.plot(view='flat_profile')
+    if args.three_d:
+        lineplot.plot(view='3d')
+
+
+if __name__ == '__main__':
+    main()